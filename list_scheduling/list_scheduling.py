@@ -18,7 +18,7 @@ def main(args):
 
     # check for duplicate names among the operations
     duplicate_name = list_scheduling.utils.check_same_name(array_operations)
-    if duplicate_name:
+    if duplicate_name is not None:
         raise ValueError(f"Error. Operation {duplicate_name} has been found twice")
 
     # print all the operations loaded
@@ -26,18 +26,15 @@ def main(args):
     for operation in array_operations:
         print(str(operation))
 
-    # perform ASAP scheduling and print the vector
-    asap_schedule = list_scheduling.schedulers.asap_scheduling(array_operations)
+    # perform ASAP and ALAP scheduling in one go (the two passes share the
+    # dependency-graph structures) and print the vectors
+    asap_schedule, alap_schedule, priority = list_scheduling.schedulers.compute_schedules(array_operations)
     print("\nASAP scheduling: ", asap_schedule)
-
-
-    # perform ALAP scheduling and print the vector
-    alap_schedule = list_scheduling.schedulers.alap_scheduling(array_operations, asap_schedule)
     print("ALAP scheduling: ", alap_schedule)
 
     # perform List scheduling
     print("\nList scheduling:")
-    list_schedule = list_scheduling.schedulers.priority_scheduling(array_operations, asap_schedule, alap_schedule, args.nmult, args.nadd)
+    list_schedule = list_scheduling.schedulers.priority_scheduling(array_operations, asap_schedule, alap_schedule, args.nmult, args.nadd, verbose=True, priority=priority)
 
     print("\nList scheduling result:")
 
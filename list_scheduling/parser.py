@@ -9,8 +9,13 @@ Functions:
 """
 
 import argparse
+import os
+
 from list_scheduling.operation import ScheduleOperation
 
+# allowed operator tokens, as a set so validation is a single hash lookup
+ALLOWED_OPERATORS = {'+', '-', '*', '/'}
+
 def process_file(file_path):
     """
     Parses a configuration file and returns a list of operations.
@@ -35,51 +40,53 @@ def process_file(file_path):
 
     Raises:
     -------
-    FileNotFoundError
-        If the file cannot be found at the specified path.
     ValueError
-        If a line does not conform to the expected format or contains invalid arguments.
+        If the file cannot be found at the specified path, or if a line does not
+        conform to the expected format or contains invalid arguments.
     """
-    try:
-        with open(file_path, 'r', encoding="utf-8") as file:
-            array_operations = []
-            for line_num, line in enumerate(file, start=1):
+    # check the path up front so the parse loop below runs outside any try frame
+    if not os.path.isfile(file_path):
+        raise ValueError(f"Error. File {file_path} not found")
+
+    # read the whole file in one call: config files are small, and one bulk
+    # read plus splitlines avoids the per-line buffered-reader overhead
+    with open(file_path, 'r', encoding="utf-8") as file:
+        lines = file.read().splitlines()
 
-                # remove leading and trailing whitespace
-                line = line.strip()
+    array_operations = []
+    for line_num, line in enumerate(lines, start=1):
 
-                # ignore comments and empty lines
-                if (line.startswith('#') or not line):
-                    continue
+        # remove leading and trailing whitespace
+        line = line.strip()
 
-                # split the line into parts
-                parts = line.split(" ")
+        # ignore comments and empty lines
+        if (line.startswith('#') or not line):
+            continue
 
-                # every line must contain 5 elements:
-                if len(parts) != 5:
-                    raise ValueError(f"Error in line {line_num}: operation misspelled ")
+        # split the line on any whitespace run (also covers tabs
+        # and multiple spaces, unlike split(" "))
+        parts = line.split()
 
-                # operations name must starts with letter 'u'
-                if not parts[0].startswith("u"):
-                    raise ValueError(f"Error in line {line_num}: operation {parts[0]} must start with the letter 'u'")
+        # every line must contain 5 elements:
+        if len(parts) != 5:
+            raise ValueError(f"Error in line {line_num}: operation misspelled ")
 
-                # the delimiter between the operation name and the operands must be ":="
-                if not parts[1] == ":=":
-                    raise ValueError(f"Error in line {line_num}: operation misspelled ")
+        # operations name must starts with letter 'u'
+        if not parts[0].startswith("u"):
+            raise ValueError(f"Error in line {line_num}: operation {parts[0]} must start with the letter 'u'")
 
-                # check allowed types of operation
-                if (not parts[3] in ['+', '-', '*', '/']):
-                    raise ValueError(f"Error in line {line_num}: operation allowed are only + - * /")
+        # the delimiter between the operation name and the operands must be ":="
+        if not parts[1] == ":=":
+            raise ValueError(f"Error in line {line_num}: operation misspelled ")
 
-                # create a new Operation object
-                new_operation = ScheduleOperation(parts[0], parts[3], parts[2], parts[4])
-                if new_operation:
-                    array_operations.append(new_operation)
+        # check allowed types of operation
+        if parts[3] not in ALLOWED_OPERATORS:
+            raise ValueError(f"Error in line {line_num}: operation allowed are only + - * /")
 
-        return array_operations
+        # create a new Operation object
+        array_operations.append(ScheduleOperation(parts[0], parts[3], parts[2], parts[4]))
 
-    except FileNotFoundError as e:
-        raise ValueError(f"Error. File {file_path} not found") from e  # Raise error
+    return array_operations
 
 def setup_parser() -> argparse.Namespace:
     """
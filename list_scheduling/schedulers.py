@@ -10,32 +10,98 @@ Functions:
 - alap_scheduling(array_operations, asap_schedule): 
     Performs ALAP scheduling by determining the latest time an operation can be scheduled without violating dependencies.
     
-- priority_scheduling(array_operations, asap_schedule, alap_schedule, n_mult, n_adder): 
+- priority_scheduling(array_operations, asap_schedule, alap_schedule, n_mult, n_adder, *, verbose=False, priority=None): 
     Schedules operations based on priority using the Priority Scheduling algorithm, considering the results from ASAP 
     and ALAP scheduling, as well as the number of available computational resources (adders and multipliers).
 
+- compute_schedules(array_operations):
+    Runs the ASAP and ALAP passes plus the priority computation over shared graph structures.
+
 Helper Functions:
 -----------------
 - priority_function(asap_schedule, alap_schedule, num_op): 
     A utility function used in priority scheduling to determine the priority of each operation based on the window
     between ASAP and ALAP schedules.
 """
+import heapq
+from collections import deque
+
 from list_scheduling.utils import priority_function
 
+def operation_arrays(array_operations):
+    """
+    Flattens a list of 'ScheduleOperation' objects into parallel per-field lists.
+
+    The scheduling loops only need the operand indexes and the operation type, but reading
+    them through the object attributes costs a Python attribute lookup on every access.
+    Extracting them once into plain lists (a struct-of-arrays layout) turns every access
+    inside the hot loops into a cheap list subscript.
+
+    Parameters:
+    -----------
+    array_operations : list[ScheduleOperation]
+        A list of 'ScheduleOperation' objects, read from the config file.
+
+    Returns:
+    --------
+    tuple[list[int], list[int], list[bool]]
+        Three parallel lists: the index of the first operand, the index of the second
+        operand (-1 for input variables) and whether the operation is a multiplication.
+    """
+    idx1 = [operation.index1 for operation in array_operations]
+    idx2 = [operation.index2 for operation in array_operations]
+    is_mult = [operation.type_op == '*' for operation in array_operations]
+
+    return idx1, idx2, is_mult
+
+def successor_lists(idx1, idx2, num_op):
+    """
+    Builds the successor adjacency of the dependency DAG.
+
+    The operand indexes encode the edges predecessor -> operation; this inverts them once
+    so every scheduling pass can walk the consumers of an operation directly instead of
+    re-deriving the relation by scanning all operations.
+
+    Parameters:
+    -----------
+    idx1 : list[int]
+        The index of the first operand of each operation (-1 for input variables).
+
+    idx2 : list[int]
+        The index of the second operand of each operation (-1 for input variables).
+
+    num_op : int
+        The number of the operations.
+
+    Returns:
+    --------
+    list[list[int]]
+        For each operation, the list of operations that consume its result.
+    """
+    successors = [[] for _ in range(num_op)]
+    for i in range(num_op):
+        if idx1[i] != -1:
+            successors[idx1[i]].append(i)
+        if idx2[i] != -1:
+            successors[idx2[i]].append(i)
+
+    return successors
+
 def asap_scheduling(array_operations):
     """
-    Performs ASAP (As Soon As Possible) scheduling on a list of operations and returns the clock cycle number in which 
+    Performs ASAP (As Soon As Possible) scheduling on a list of operations and returns the clock cycle number in which
     each operation is performed.
 
-    This function simulates the ASAP scheduling algorithm, which schedules operations as early as possible, 
-    taking into account data dependencies. Operations can only be scheduled when their input operands are available 
-    (either as inputs or the results of previously scheduled operations).
+    The schedule is computed with a single Kahn-style topological traversal: operations whose operands
+    are all input variables start in cycle 1, and every other operation starts one cycle after the
+    latest of its two operands. This visits each operation exactly once (O(N) work) instead of
+    re-scanning the whole list on every simulated clock cycle.
 
     Parameters:
     -----------
     array_operations : list[ScheduleOperation]
         A list of 'ScheduleOperation' objects, read from the config file, where each operation specifies its dependencies via 'index1' and 'index2'.
-        
+
     Returns:
     --------
     list[int]
@@ -46,55 +112,42 @@ def asap_scheduling(array_operations):
     --------
     >>> asap_scheduling(array_operations)
     [1, 1, 2]
-    
+
     This means the first two operations are scheduled in cycle 1, and the third operation is scheduled in cycle 2.
     """
     num_op = len(array_operations)
+
+    # hoist the operand indexes into plain lists once
+    idx1, idx2, _ = operation_arrays(array_operations)
+
+    # successors[i] lists the operations that consume the result of operation i
+    successors = successor_lists(idx1, idx2, num_op)
+
+    return _asap_pass(idx1, idx2, successors, num_op)
+
+def _asap_pass(idx1, idx2, successors, num_op):
+    """Kahn-style topological pass computing the ASAP cycle of every operation."""
+    # unmet[i] counts how many operands of operation i are still waiting
+    unmet = bytearray((idx1[i] != -1) + (idx2[i] != -1) for i in range(num_op))
+
     # done tracks the clock cycle in wich an operation is performed
-    # both arrays are initialized with the value -1 (operation is still waiting)
+    # initialized with the value -1 (operation is still waiting)
     done = [-1] * num_op
-    temp = [-1] * num_op
-
-    for clk in range(1, num_op+1):
-        for i in range(num_op):
-
-            if done[i] != -1: # the operation has already been performed in a previous clk cycle
-                continue
-
-            # Get the input operand indexes
-            index1 = array_operations[i].index1
-            index2 = array_operations[i].index2
-
-            # check if both operands are input variable
-            # if True, the operation can be done in this clock cycle
-            if index1 == -1 and index2 == -1:
-                temp[i] = clk
-                continue
-
-            # Check if the first operand is available
-            if index1 != -1 and done[index1] != -1:
-                if index2 != -1 and done[index2] != -1:
-                    # both operands are available -> schedule now
-                    temp[i] = clk
-                    continue
-
-                if index2 == -1:
-                    # op1 is done and op2 is an input variable -> scheule now
-                    temp[i] = clk
-                    continue
-
-            if index1 == -1 and index2 != -1 and done[index2] != -1:
-                # op1 is an input variable and op2 is done -> schedule now
-                temp[i] = clk
-                continue
-
-        if done == temp:
-            # no changes in the last clk cycle, so break the loop
-            clk -= 1
-            break
 
-        # update the done array after every clk cycle
-        done = temp.copy()
+    # start from the operations whose operands are both input variables
+    queue = deque(i for i in range(num_op) if unmet[i] == 0)
+
+    while queue:
+        i = queue.popleft()
+
+        # an operation runs one cycle after the latest of its operands
+        # (input variables are available from the start, hence the default 0)
+        done[i] = 1 + max((done[parent] for parent in (idx1[i], idx2[i]) if parent != -1), default=0)
+
+        for succ in successors[i]:
+            unmet[succ] -= 1
+            if unmet[succ] == 0:
+                queue.append(succ)
 
     return done
 
@@ -103,9 +156,11 @@ def alap_scheduling(array_operations, asap_schedule):
     Performs ALAP (As Late As Possible) scheduling on a list of operations, based on the given ASAP schedule, 
     and returns the clock cycle number in which each operation is performed.
 
-    ALAP scheduling schedules operations as late as possible while still satisfying data dependencies. 
-    It works backwards from the latest operation (determined from the ASAP schedule) and schedules earlier operations 
-    based on when their results are needed by dependent operations.
+    ALAP scheduling schedules operations as late as possible while still satisfying data dependencies.
+    The schedule is computed with a single reverse-topological pass: operations without consumers
+    (the sinks of the DAG) are placed in the last cycle of the ASAP schedule, and every other
+    operation is placed one cycle before the earliest of its consumers. Each operation is visited
+    exactly once, so the pass is O(N + E) with no per-cycle list copies.
 
     Parameters:
     -----------
@@ -123,37 +178,65 @@ def alap_scheduling(array_operations, asap_schedule):
     """
     num_op = len(array_operations)
 
-    # init done array
-    done = [-1] * num_op
+    # hoist the operand indexes into plain lists once
+    idx1, idx2, _ = operation_arrays(array_operations)
+
+    # successors[i] lists the operations that consume the result of operation i
+    successors = successor_lists(idx1, idx2, num_op)
 
+    return _alap_pass(successors, asap_schedule, num_op)
+
+def _alap_pass(successors, asap_schedule, num_op):
+    """Reverse-topological pass computing the ALAP cycle of every operation."""
     # search for the clock max in the asap schedule
     clk_max = max(asap_schedule)
-    # search for the index of the last operation in the asap schedule
-    pos = asap_schedule.index(clk_max)
-    # the last operation in asap is also the last operation in alap
-    done[pos] = clk_max
 
-    temp = done.copy()
+    # sinks (operations without consumers) are scheduled in the last cycle
+    done = [clk_max] * num_op
 
-    # starting from clk-1 and proceed backwards
-    for clk in range(clk_max - 1, 0, -1):
-        for i in range(num_op):
-            if done[i] == clk + 1:
-                # pick the the index of the two operands
-                index1 = array_operations[i].index1
-                index2 = array_operations[i].index2
+    # visit the operations in decreasing ASAP order: every consumer has a strictly
+    # larger ASAP cycle than its producer, so its ALAP value is already final
+    for i in sorted(range(num_op), key=asap_schedule.__getitem__, reverse=True):
+        if successors[i]:
+            # schedule one cycle before the earliest consumer
+            done[i] = min(done[succ] for succ in successors[i]) - 1
 
-                # if op1 and op2 are NOT input variable -> schedule the operation now
-                if index1 != -1:
-                    temp[index1] = clk
-                if index2 != -1:
-                    temp[index2] = clk
+    return done
 
-        done = temp.copy()
+def compute_schedules(array_operations):
+    """
+    Computes the ASAP schedule, the ALAP schedule and the operation priorities in one go.
 
-    return done
+    Running the two passes through this helper builds the flattened operand arrays and
+    the successor adjacency a single time and shares them, instead of having each
+    scheduling function re-derive them from the operation objects.
+
+    Parameters:
+    -----------
+    array_operations : list[ScheduleOperation]
+        A list of 'ScheduleOperation' objects, read from the config file.
 
-def priority_scheduling(array_operations, asap_schedule, alap_schedule, n_mult, n_adder):
+    Returns:
+    --------
+    tuple[list[int], list[int], list[int]]
+        The ASAP schedule, the ALAP schedule and the priority of each operation
+        (computed as in 'priority_function').
+    """
+    num_op = len(array_operations)
+
+    idx1, idx2, _ = operation_arrays(array_operations)
+    successors = successor_lists(idx1, idx2, num_op)
+
+    asap_schedule = _asap_pass(idx1, idx2, successors, num_op)
+    alap_schedule = _alap_pass(successors, asap_schedule, num_op)
+    priority = priority_function(asap_schedule, alap_schedule, num_op)
+
+    return asap_schedule, alap_schedule, priority
+
+# the five scheduling inputs plus the two keyword-only knobs are inherent to the
+# algorithm, and the state vectors of the incremental kernel dominate the locals
+# pylint: disable-next=too-many-arguments, too-many-locals
+def priority_scheduling(array_operations, asap_schedule, alap_schedule, n_mult, n_adder, *, verbose=False, priority=None):
     """
     Schedules operations based on priority using the Priority Scheduling algorithm, considering both 
     ALAP and ASAP schedules, as well as the number of available adders and multipliers.
@@ -182,6 +265,14 @@ def priority_scheduling(array_operations, asap_schedule, alap_schedule, n_mult,
     n_adder : int
         The number of adders available for scheduling operations (command line argument).
 
+    verbose : bool
+        If True, prints the ready operations and the adder/multiplier assignments on
+        every clock cycle. Off by default so library callers pay no I/O cost.
+
+    priority : list[int], optional
+        The priority of each operation, as returned by 'compute_schedules'. When omitted
+        it is derived here from the ASAP and ALAP schedules via 'priority_function'.
+
     Returns:
     --------
     list[int]
@@ -189,108 +280,79 @@ def priority_scheduling(array_operations, asap_schedule, alap_schedule, n_mult,
     """
     num_op = len(array_operations)
 
-    # init state variables
-    ready = [0] * num_op
-    temp = [0] * num_op
-    scheduling = [-1] * num_op
+    # hoist the operand indexes and operation types into plain lists once
+    idx1, idx2, is_mult = operation_arrays(array_operations)
 
-    add = [-1] * num_op
-    mult = [-1] * num_op
+    # successors[i] lists the operations that consume the result of operation i
+    successors = successor_lists(idx1, idx2, num_op)
 
-    # get operation priorities based on ASAP and ALAP schedules
-    priority = priority_function(asap_schedule, alap_schedule, num_op)
+    # unmet[i] counts how many operands of operation i are still waiting
+    # (at most 2, so a bytearray is enough and far denser than a list of ints)
+    unmet = bytearray((idx1[i] != -1) + (idx2[i] != -1) for i in range(num_op))
+
+    # get operation priorities based on ASAP and ALAP schedules, unless the
+    # caller already has them from compute_schedules
+    if priority is None:
+        priority = priority_function(asap_schedule, alap_schedule, num_op)
+
+    # init state variables
+    scheduling = [-1] * num_op
+    scheduled_count = 0
 
-    # 'done' and 'temp' vectors have the values:
+    # the 'ready' vector has the values:
     # 0 if the corresponding operation is not ready
     # 1 if it's ready but not yet executed
     # 2 if it's executed
+    # it is maintained incrementally (and used for the verbose report): instead
+    # of re-scanning all operations every cycle, an operation is pushed onto the
+    # heap of its resource the moment its last pending operand is executed
+    ready = bytearray(num_op)
+
+    # per-resource heaps of (-priority, index) so that the highest priority pops
+    # first and ties keep favouring the lowest operation index
+    add_heap = []
+    mult_heap = []
+
+    def mark_ready(i):
+        ready[i] = 1
+        heap = mult_heap if is_mult[i] else add_heap
+        heapq.heappush(heap, (-priority[i], i))
+
+    # operations whose operands are both input variables are ready from the start
+    for i in range(num_op):
+        if unmet[i] == 0:
+            mark_ready(i)
 
     for clk in range(1, num_op + 1):
-        for i in range(num_op):
-            # search for ready operations in this clk cycle
-            # operation is ready if the inputs are -1 (input variable) or 2 (operands available)
-            if ready[i] != 0:
-                continue
-
-            index1 = array_operations[i].index1
-            index2 = array_operations[i].index2
-
-            # check if both operands are input variable (index = -1)
-            if index1 == -1 and index2 == -1:
-                # if conditions are met, changes its status to ready (1)
-                temp[i] = 1
-                continue
-
-            # check if op1 is done and op2 is either an input variable or done
-            if index1 != -1 and ready[index1] == 2:
-                if index2 == -1 or (index2 != -1 and ready[index2] == 2):
-                    temp[i] = 1
-                    continue
-
-            # check if op1 is an input variable and op2 is done
-            if index2 != -1 and ready[index2] == 2 and index1 == -1:
-                temp[i] = 1
-                continue
-
-        ready = temp.copy()
-
-        # print current clock cycle and ready operations
-        print("clk: ", clk)
-        print("ready operations: ", ready)
-
-        # init adder and multiplier queues
-        add = [-1] * n_adder
-        mult = [-1] * n_mult
-
-        # assign operations to adders and multipliers based on priority
-        # adders
-        for i in range(n_adder):
-            for j in range(num_op):
-                if array_operations[j].type_op == '+' and ready[j] == 1:
-                    if j in add:
-                        # operation j is already in the add[] vector, skip
-                        continue
-                    if add[i] == -1:
-                        # if one adders is empty, assign the operation j
-                        add[i] = j
-                    elif priority[add[i]] < priority[j]:
-                        # if another operation with higher priority is found, replace it
-                        add[i] = j
-
-        print("adders: ", add)
-
-        # execute additions and mark the corresponding operations as scheduled (2)
-        for i in range(n_adder):
-            if add[i] != -1:
-                temp[add[i]] = 2
-                scheduling[add[i]] = clk
-
-        # multipliers
-        for i in range(n_mult):
-            for j in range(num_op):
-                if array_operations[j].type_op == '*' and ready[j] == 1:
-                    if j in mult:
-                        continue
-                    if mult[i] == -1:
-                        mult[i] = j
-                    elif priority[mult[i]] < priority[j]:
-                        mult[i] = j
-
-        print("multipliers: ", mult)
-        # print blank line for better readability
-        print()
-
-        # execute multiplication and mark the corresponding operations as scheduled (2)
-        for i in range(n_mult):
-            if mult[i] != -1:
-                temp[mult[i]] = 2
-                scheduling[mult[i]] = clk
-
-        # update the ready[] vector
-        ready = temp.copy()
+        # assign operations to adders and multipliers based on priority by
+        # popping up to one operation per available resource from each heap
+        chosen_add = [heapq.heappop(add_heap)[1] for _ in range(min(n_adder, len(add_heap)))]
+        chosen_mult = [heapq.heappop(mult_heap)[1] for _ in range(min(n_mult, len(mult_heap)))]
+
+        if verbose:
+            # report the whole cycle (clock, ready vector and the fixed-width
+            # slot views, -1 = idle resource) with a single stdout write
+            add = chosen_add + [-1] * (n_adder - len(chosen_add))
+            mult = chosen_mult + [-1] * (n_mult - len(chosen_mult))
+            print(f"clk:  {clk}\n"
+                  f"ready operations:  {list(ready)}\n"
+                  f"adders:  {add}\n"
+                  f"multipliers:  {mult}\n")
+
+        # execute the chosen operations, mark them as scheduled (2) and release
+        # the consumers whose last pending operand just became available
+        for j in chosen_add + chosen_mult:
+            ready[j] = 2
+            scheduling[j] = clk
+            scheduled_count += 1
+
+            for succ in successors[j]:
+                unmet[succ] -= 1
+                if unmet[succ] == 0:
+                    mark_ready(succ)
 
         # check if all operation are marked as done. if true, exit the loop
-        if all(x == 2 for x in ready):
+        if scheduled_count == num_op:
             break
 
     return scheduling
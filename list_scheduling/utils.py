@@ -48,9 +48,10 @@ def check_same_name(objects):
     """
     Checks if any operation name appears more than once in the provided list of objects.
 
-    This function iterates through a list of objects and checks if any two objects share the same name.
+    This function makes a single pass over the objects, remembering every name seen so far
+    in a set, so each check is a constant-time lookup instead of a scan over the whole list.
     If a duplicate name is found, it returns that name.
-    If no duplicates are found, it returns 'False'.
+    If no duplicates are found, it returns 'None'.
 
     Parameters:
     -----------
@@ -59,12 +60,13 @@ def check_same_name(objects):
 
     Returns:
     --------
-    str or bool
-        The name of the duplicate operation if found. Returns 'False' if no duplicates are found.
+    str or None
+        The name of the duplicate operation if found. Returns 'None' if no duplicates are found.
     """
-    for i, obj1 in enumerate(objects):
-        for obj2 in objects[i + 1:]: # iterate over the remaining objects
-            if obj1.name == obj2.name:
-                return obj1.name
+    seen = set()
+    for obj in objects:
+        if obj.name in seen:
+            return obj.name
+        seen.add(obj.name)
 
-    return False
+    return None
@@ -1,30 +1,42 @@
 import pytest
-import tempfile
-import os
 import sys
 import argparse
+from operator import attrgetter
+
+# module imports are kept for the TestListScheduling mocks, which patch
+# attributes on the modules themselves
 import list_scheduling.utils
-import list_scheduling.operation
 import list_scheduling.schedulers
 import list_scheduling.parser
-import list_scheduling.list_scheduling
 
-@pytest.fixture
+from list_scheduling.operation import ScheduleOperation
+from list_scheduling.parser import process_file, setup_parser
+from list_scheduling.schedulers import asap_scheduling, alap_scheduling, priority_scheduling, compute_schedules
+from list_scheduling.utils import priority_function, check_same_name
+from list_scheduling.list_scheduling import main
+
+# (name, type_op, input1, input2) tuples describing the shared test graph;
+# fixtures build the ScheduleOperation objects from this static table
+_OP_SPECS = (
+    ('u0', '+', 'a', 'b'),   # Operation 0: No dependencies
+    ('u1', '*', 'c', 'd'),   # Operation 1: No dependencies
+    ('u2', '*', 'e', 'f'),   # Operation 2: No dependencies
+    ('u3', '*', 'g', 'h'),   # Operation 3: No dependencies
+    ('u4', '+', 'u0', 'u1'), # Operation 4: Depends on Operations 0 and 1
+    ('u5', '+', 'u3', 'i'),  # Operation 5: Depends on Operations 3
+    ('u6', '*', 'u4', 'j'),  # Operation 6: Depends on Operation 4
+    ('u7', '*', 'u6', 'u2'), # Operation 7: Depends on Operations 2 and 6
+    ('u8', '*', 'u7', 'u5')  # Operation 8: Depends on Operations 5 and 7
+)
+
+@pytest.fixture(scope="module")
 def operations():
     """
     Create a list of ScheduleOperation objects for testing purposes.
+
+    The tests only read the operations, so one shared instance per module is enough.
     """
-    return [
-        list_scheduling.operation.ScheduleOperation('u0', '+', 'a', 'b'), # Operation 0: No dependencies
-        list_scheduling.operation.ScheduleOperation('u1', '*', 'c', 'd'), # Operation 1: No dependencies
-        list_scheduling.operation.ScheduleOperation('u2', '*', 'e', 'f'), # Operation 2: No dependencies
-        list_scheduling.operation.ScheduleOperation('u3', '*', 'g', 'h'), # Operation 3: No dependencies
-        list_scheduling.operation.ScheduleOperation('u4', '+', 'u0', 'u1'),# Operation 4: Depends on Operations 0 and 1
-        list_scheduling.operation.ScheduleOperation('u5', '+', 'u3', 'i'), # Operation 5: Depends on Operations 3
-        list_scheduling.operation.ScheduleOperation('u6', '*', 'u4', 'j'), # Operation 6: Depends on Operation 4
-        list_scheduling.operation.ScheduleOperation('u7', '*', 'u6', 'u2'),# Operation 7: Depends on Operations 2 and 6
-        list_scheduling.operation.ScheduleOperation('u8', '*', 'u7', 'u5') # Operation 8: Depends on Operations 5 and 7
-    ]
+    return [ScheduleOperation(*spec) for spec in _OP_SPECS]
 
 class TestUnitUtils:
     @pytest.mark.parametrize("asap, alap, num_op, result", [
@@ -44,7 +56,7 @@ class TestUnitUtils:
         #num_op = len(asap)
         #expected_priority = [1, 2, 1, 1, 1, 1]
 
-        priority = list_scheduling.utils.priority_function(asap, alap, num_op)
+        priority = priority_function(asap, alap, num_op)
 
         assert priority == result
 
@@ -52,184 +64,155 @@ class TestUnitUtils:
         """
         Test the check_same_name function with two operations with the same name.
         """
-        op1 = list_scheduling.operation.ScheduleOperation("u0", "+", "a", "b")
-        op2 = list_scheduling.operation.ScheduleOperation("u0", "+", "c", "d")
+        op1 = ScheduleOperation("u0", "+", "a", "b")
+        op2 = ScheduleOperation("u0", "+", "c", "d")
         expected_res = "u0"
 
         vector = [op1, op2]
 
-        res = list_scheduling.utils.check_same_name(vector)
+        res = check_same_name(vector)
 
         assert res == expected_res
     
     def test_check_same_name_false(self):
         """
         Test the check_same_name function with two operations with different names
-        (must return 'False').
+        (must return 'None').
         """
-        op1 = list_scheduling.operation.ScheduleOperation("u0", "+", "a", "b")
-        op2 = list_scheduling.operation.ScheduleOperation("u1", "+", "c", "d")
-        
+        op1 = ScheduleOperation("u0", "+", "a", "b")
+        op2 = ScheduleOperation("u1", "+", "c", "d")
+
         vector = [op1, op2]
 
-        res = list_scheduling.utils.check_same_name(vector)
+        res = check_same_name(vector)
 
-        assert res == False
+        assert res is None
 
     def test_str_ScheduleOperation(self):
         """
         Test the __str__ method of the ScheduleOperation class.
         """
-        operation = list_scheduling.operation.ScheduleOperation("u0", "+", "a", "b")
+        operation = ScheduleOperation("u0", "+", "a", "b")
         expected_str = "u0 := a + b"
 
         res = str(operation)
 
         assert res == expected_str
 
+@pytest.fixture(scope="module")
+def asap(operations):
+    """
+    ASAP schedule of the shared operations, computed once per module and reused
+    by the ALAP and priority tests instead of re-specifying the literals.
+    """
+    return asap_scheduling(operations)
+
+@pytest.fixture(scope="module")
+def alap(operations, asap):
+    """
+    ALAP schedule derived from the shared ASAP schedule, computed once per module.
+    """
+    return alap_scheduling(operations, asap)
+
 class TestUnitSchedulers:
     """
     Test the scheduling functions.
     """
-    #@pytest.mark.skip(reason="skip for now")
-    @pytest.mark.usefixtures("operations")
-    def test_asap_scheduling(self, operations):
+    def test_asap_scheduling(self, asap):
         expected_asap = [1, 1, 1, 1, 2, 2, 3, 4, 5]
 
-        result = list_scheduling.schedulers.asap_scheduling(operations)
+        assert asap == expected_asap
 
-        assert result == expected_asap
-
-    @pytest.mark.usefixtures("operations")
-    def test_alap_scheduling(self, operations):
-        asap = [1, 1, 1, 1, 2, 2, 3, 4, 5]
+    def test_alap_scheduling(self, alap):
         expected_alap = [1, 1, 3, 3, 2, 4, 3, 4, 5]
 
-        result = list_scheduling.schedulers.alap_scheduling(operations, asap)
+        assert alap == expected_alap
 
-        assert result == expected_alap
-    
-    @pytest.mark.usefixtures("operations")
-    def test_priority_scheduling(self, operations):
-        asap = [1, 1, 1, 1, 2, 2, 3, 4, 5]
-        alap = [1, 1, 3, 3, 2, 4, 3, 4, 5]
-        n_mult = 2
-        n_add = 2
+    @pytest.mark.parametrize("n_mult, n_add, expected", [
+        (2, 2, [1, 2, 1, 1, 3, 2, 4, 5, 6]),
+        (2, 3, [1, 2, 1, 1, 3, 2, 4, 5, 6]),
+        (1, 1, [1, 3, 1, 2, 4, 3, 5, 6, 7]),
+        (3, 1, [1, 1, 1, 1, 3, 2, 4, 5, 6])
+        ])
+    def test_priority_scheduling(self, operations, asap, alap, n_mult, n_add, expected):
+        result = priority_scheduling(operations, asap, alap, n_mult, n_add)
 
-        expected_priority_schedule = [1, 2, 1, 1, 3, 2, 4, 5, 6]
+        assert result == expected
 
-        result = list_scheduling.schedulers.priority_scheduling(operations, asap, alap, n_mult, n_add)
+    def test_compute_schedules(self, operations, asap, alap):
+        """
+        Test that compute_schedules returns the same ASAP and ALAP schedules as the
+        standalone functions, together with the priorities (alap - asap + 1).
+        """
+        expected_priority = [1, 1, 3, 3, 1, 3, 1, 1, 1]
 
-        assert result == expected_priority_schedule
+        asap_result, alap_result, priority = compute_schedules(operations)
+
+        assert asap_result == asap
+        assert alap_result == alap
+        assert priority == expected_priority
 
 class TestParser:
-    def test_process_file_valid(self):
+    def test_process_file_valid(self, tmp_path):
         """
         Test the process_file function with a valid file.
         """
         # create a temporary file with valid operations
-        with tempfile.NamedTemporaryFile(delete=False, mode='w', encoding='utf-8') as temp_file:
-            temp_file.write("# this comment should be ignored\n")
-            temp_file.write("u0 := a + b\n")
-            temp_file.write("u1 := c * d\n")
-            temp_file.write("u2 := e - f\n")
-            temp_file.write("u3 := u0 / u1\n")
-            temp_file_path = temp_file.name
-        
-        try:
-            operations_read = list_scheduling.parser.process_file(temp_file_path)
-
-            expected_operations = [
-                list_scheduling.operation.ScheduleOperation('u0', '+', 'a', 'b'),
-                list_scheduling.operation.ScheduleOperation('u1', '*', 'c', 'd'),
-                list_scheduling.operation.ScheduleOperation('u2', '+', 'e', 'f'), # '-' conveerted to '+'
-                list_scheduling.operation.ScheduleOperation('u3', '*', 'u0', 'u1') # '/' converted to '*'
-            ]
-
-            # assertions
-            assert len(operations_read) == len(expected_operations)
-            for i in range(len(operations_read)):
-                assert operations_read[i].name == expected_operations[i].name
-                assert operations_read[i].type_op == expected_operations[i].type_op
-                assert operations_read[i].input1 == expected_operations[i].input1
-                assert operations_read[i].input2 == expected_operations[i].input2
-        
-        finally:
-            os.remove(temp_file_path)
-
-    def test_process_file_invalid_arguments(self):
-        """
-        Test the process_file function with an invalid file where the number of arguments is not 5.
-        """
-        # create a temporary file exceeding the max number of arguments (5)
-        with tempfile.NamedTemporaryFile(delete=False, mode='w', encoding='utf-8') as temp_file:
-            temp_file.write("u0 := a + b * c\n")
-            temp_file_path = temp_file.name
-
-        try:
-            # calling the function should raise a ValueError
-            with pytest.raises(ValueError, match="Error in line 1: operation misspelled"):
-                list_scheduling.parser.process_file(temp_file_path)
-        finally:
-            os.remove(temp_file_path)
-    
-    def test_process_file_invalid_operation(self):
-        """
-        Test the process_file function with an invalid operation name
-        where the operation name is invalid (must start with 'u').
-        """
-        # create a temporary file with an invalid operation
-        with tempfile.NamedTemporaryFile(delete=False, mode='w', encoding='utf-8') as temp_file:
-            temp_file.write("a0 := a + b\n")
-            temp_file_path = temp_file.name
-        
-        try:
-            # calling the function should raise a ValueError
-            with pytest.raises(ValueError, match="Error in line 1: operation a0 must start with the letter 'u'"):
-                list_scheduling.parser.process_file(temp_file_path)
-        finally:
-            os.remove(temp_file_path)
-    
-    def test_process_file_invalid_delimiter(self):
-        """
-        Test the process_file function with an invalid operation
-        where the delimiter between the operation name and operands is invalid.
-        """
-        # create a temporary file with an invalid operation
-        with tempfile.NamedTemporaryFile(delete=False, mode='w', encoding='utf-8') as temp_file:
-            temp_file.write("u0 = a + b\n")
-            temp_file_path = temp_file.name
-        
-        try:
-            # calling the function should raise a ValueError
-            with pytest.raises(ValueError, match="Error in line 1: operation misspelled"):
-                list_scheduling.parser.process_file(temp_file_path)
-        finally:
-            os.remove(temp_file_path)
-
-    def test_process_file_invalid_operation_type(self):
+        config_file = tmp_path / "config.txt"
+        config_file.write_text(
+            "# this comment should be ignored\n"
+            "u0 := a + b\n"
+            "u1 := c * d\n"
+            "u2 := e - f\n"
+            "u3 := u0 / u1\n",
+            encoding='utf-8'
+        )
+
+        operations_read = process_file(str(config_file))
+
+        expected_operations = [
+            ScheduleOperation('u0', '+', 'a', 'b'),
+            ScheduleOperation('u1', '*', 'c', 'd'),
+            ScheduleOperation('u2', '+', 'e', 'f'), # '-' conveerted to '+'
+            ScheduleOperation('u3', '*', 'u0', 'u1') # '/' converted to '*'
+        ]
+
+        # assertions: compare the operations field-by-field in one go
+        # (the list comparison already fails on a length mismatch)
+        key = attrgetter('name', 'type_op', 'input1', 'input2')
+        assert [key(op) for op in operations_read] == [key(op) for op in expected_operations]
+
+    @pytest.mark.parametrize("content, match", [
+        pytest.param("u0 := a + b * c\n", "Error in line 1: operation misspelled",
+                     id="invalid_arguments"),
+        pytest.param("a0 := a + b\n", "Error in line 1: operation a0 must start with the letter 'u'",
+                     id="invalid_operation"),
+        pytest.param("u0 = a + b\n", "Error in line 1: operation misspelled",
+                     id="invalid_delimiter"),
+        pytest.param("u0 := a x b\n", r"Error in line 1: operation allowed are only \+ - \* /",
+                     id="invalid_operation_type")
+        ])
+    def test_process_file_invalid(self, tmp_path, content, match):
         """
-        Test the process_file function with an invalid operation
-        where the operation type is invalid (must be '+', '-', '*', '/').
+        Test the process_file function with invalid files: wrong number of arguments,
+        an operation name not starting with 'u', a bad delimiter and an unknown
+        operation type. Each case must raise a ValueError with its own message.
         """
-        # create a temporary file with an invalid operation
-        with tempfile.NamedTemporaryFile(delete=False, mode='w', encoding='utf-8') as temp_file:
-            temp_file.write("u0 := a x b\n")
-            temp_file_path = temp_file.name
-        
-        try:
-            # calling the function should raise a ValueError
-            with pytest.raises(ValueError, match=r"Error in line 1: operation allowed are only \+ - \* /"):
-                list_scheduling.parser.process_file(temp_file_path)
-        finally:
-            os.remove(temp_file_path)
+        # create a temporary file with the invalid operation
+        config_file = tmp_path / "config.txt"
+        config_file.write_text(content, encoding='utf-8')
+
+        # calling the function should raise a ValueError
+        with pytest.raises(ValueError, match=match):
+            process_file(str(config_file))
+
     def test_process_file_file_not_found(self):
         """
         Test the process_file function with a file that does not exist.
         """
         # calling the function should raise a ValueError
         with pytest.raises(ValueError, match="Error. File file_not_existent.txt not found"):
-            list_scheduling.parser.process_file("file_not_existent.txt")
+            process_file("file_not_existent.txt")
 
     def test_setup_parser_valid(self, monkeypatch):
         """
@@ -243,76 +226,65 @@ class TestParser:
         monkeypatch.setattr(sys, 'argv', test_args)
 
         # call the setup_parser function
-        args = list_scheduling.parser.setup_parser()
+        args = setup_parser()
 
         assert args.file == "config.txt"
         assert args.nmult == 2
         assert args.nadd == 2
 
 class TestListScheduling:
-    @pytest.fixture
-    def mock_setup_parser(self, monkeypatch):
-        def mock_parser():
-            return argparse.Namespace(file="config.txt", nmult=2, nadd=2)
-        monkeypatch.setattr(list_scheduling.parser, 'setup_parser', mock_parser)
+    _MOCK_OP_SPECS = (
+        ('u0', '+', 'a', 'b'),
+        ('u1', '*', 'c', 'd'),
+        ('u2', '+', 'u0', 'e'),
+        ('u3', '*', 'u1', 'u2')
+    )
 
     @pytest.fixture
-    def mock_process_file(self, monkeypatch):
+    def mocked_pipeline(self, monkeypatch):
+        """
+        Replace every stage main() relies on with a mock, in one fixture:
+        argument parsing, file processing, the duplicate-name check and
+        the two scheduling calls (compute_schedules and priority_scheduling).
+        """
         def mock_process(file):
-            return [
-                list_scheduling.operation.ScheduleOperation('u0', '+', 'a', 'b'),
-                list_scheduling.operation.ScheduleOperation('u1', '*', 'c', 'd'),
-                list_scheduling.operation.ScheduleOperation('u2', '+', 'u0', 'e'),
-                list_scheduling.operation.ScheduleOperation('u3', '*', 'u1', 'u2')
-            ]
+            return [ScheduleOperation(*spec) for spec in self._MOCK_OP_SPECS]
+
+        monkeypatch.setattr(list_scheduling.parser, 'setup_parser',
+                            lambda: argparse.Namespace(file="config.txt", nmult=2, nadd=2))
         monkeypatch.setattr(list_scheduling.parser, 'process_file', mock_process)
-    
-    @pytest.fixture
-    def mock_check_same_name(self, monkeypatch):
-        def mock_check(operations):
-            return False
-        monkeypatch.setattr(list_scheduling.utils, 'check_same_name', mock_check)
-    
-    @pytest.fixture
-    def mock_asap_scheduling(self, monkeypatch):
-        def mock_asap(operations):
-            return [1, 1, 2, 3]
-        monkeypatch.setattr(list_scheduling.schedulers, 'asap_scheduling', mock_asap)
-    
-    @pytest.fixture
-    def mock_alap_scheduling(self, monkeypatch):
-        def mock_alap(operations, asap_schedule):
-            return [1, 2, 2, 3]
-        monkeypatch.setattr(list_scheduling.schedulers, 'alap_scheduling', mock_alap)
-    
+        monkeypatch.setattr(list_scheduling.utils, 'check_same_name',
+                            lambda operations: None)
+        monkeypatch.setattr(list_scheduling.schedulers, 'compute_schedules',
+                            lambda operations: ([1, 1, 2, 3], [1, 2, 2, 3], [1, 2, 1, 1]))
+        monkeypatch.setattr(list_scheduling.schedulers, 'priority_scheduling',
+                            lambda operations, asap_schedule, alap_schedule, n_mult, n_add, verbose=False, priority=None: [1, 1, 2, 3])
+        return monkeypatch
+
     @pytest.fixture
-    def mock_priority_scheduling(self, monkeypatch):
-        def mock_priority(operations, asap_schedule, alap_schedule, n_mult, n_add):
-            return [1, 1, 2, 3]
-        monkeypatch.setattr(list_scheduling.schedulers, 'priority_scheduling', mock_priority)
+    def mocked_pipeline_duplicate(self, mocked_pipeline):
+        """
+        Same mocked pipeline, but with check_same_name reporting a duplicate.
+        """
+        mocked_pipeline.setattr(list_scheduling.utils, 'check_same_name',
+                                lambda operations: "u0")
 
     #@pytest.mark.skip(reason="skip for now")
-    def test_main_valid_input(self, mock_priority_scheduling, mock_alap_scheduling, mock_asap_scheduling, mock_check_same_name, mock_process_file, mock_setup_parser):
+    def test_main_valid_input(self, mocked_pipeline):
         """
         Test the main function with valid input.
         """
         # call the main function
         args = list_scheduling.parser.setup_parser()
-        res = list_scheduling.list_scheduling.main(args)
+        res = main(args)
 
         assert res == [1, 1, 2, 3]
-    
-    @pytest.fixture
-    def mock_check_same_name_true(self, monkeypatch):
-        def mock_check(operations):
-            return "u0"
-        monkeypatch.setattr(list_scheduling.utils, 'check_same_name', mock_check)
-    
-    def test_main_duplicate(self, mock_check_same_name_true, mock_priority_scheduling, mock_alap_scheduling, mock_asap_scheduling, mock_process_file, mock_setup_parser):
+
+    def test_main_duplicate(self, mocked_pipeline_duplicate):
         """
         Test the main function with duplicate operation names.
         It should raise a ValueError.
         """
         with pytest.raises(ValueError, match="Error. Operation u0 has been found twice"):
             args = list_scheduling.parser.setup_parser()
-            list_scheduling.list_scheduling.main(args)
\ No newline at end of file
+            main(args)